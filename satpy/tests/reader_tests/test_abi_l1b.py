@@ -21,6 +21,7 @@
 from __future__ import annotations
 
 import datetime as dt
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable
 from unittest import mock
@@ -44,6 +45,56 @@ RAD_SHAPE = {
 RAD_SHAPE[1000] = (RAD_SHAPE[500][0] // 2, RAD_SHAPE[500][1] // 2)
 RAD_SHAPE[2000] = (RAD_SHAPE[500][0] // 4, RAD_SHAPE[500][1] // 4)
 
+_C07_RAD_DATA = (np.arange(RAD_SHAPE[2000][0] * RAD_SHAPE[2000][1]).reshape(RAD_SHAPE[2000]) + 1.0) * 50.0
+_C07_RAD_DATA[0, 0] = -0.0001  # introduce below minimum expected radiance
+_C07_RAD_DATA = ((_C07_RAD_DATA + 1.3) / 0.5).astype(np.int16)
+_C07_RAD_DATA.flags.writeable = False
+
+_IR_EXPECTED = np.array(
+    [
+        np.nan,
+        304.97037,
+        332.22778,
+        354.6147,
+        374.08688,
+        391.58655,
+        407.64786,
+        422.60635,
+        436.68802,
+        np.nan,
+    ]
+)
+_CLIP_IR_EXPECTED = _IR_EXPECTED.copy()
+_CLIP_IR_EXPECTED[0] = 134.68753
+_VIS_EXPECTED = np.array(
+    [
+        7.632808,
+        15.265616,
+        22.898426,
+        30.531233,
+        38.164043,
+        45.796852,
+        53.429657,
+        61.062466,
+        68.695274,
+        np.nan,
+    ]
+)
+
+
+@lru_cache(maxsize=None)
+def _fake_rad_data(resolution: int) -> npt.NDArray[np.int16]:
+    """Get the default fake radiance counts for a resolution.
+
+    The array is cached and shared between callers, so it is made read-only.
+    """
+    shape = RAD_SHAPE[resolution]
+    rad_data = (np.arange(shape[0] * shape[1]).reshape(shape) + 1.0) * 50.0
+    rad_data = (rad_data + 1.0) / 0.5
+    rad_data = rad_data.astype(np.int16)
+    rad_data.flags.writeable = False
+    return rad_data
+
 
 def _create_fake_rad_dataarray(
     rad: xr.DataArray | None = None,
@@ -52,13 +103,9 @@ def _create_fake_rad_dataarray(
     x_image = xr.DataArray(0.0)
     y_image = xr.DataArray(0.0)
     time = xr.DataArray(0.0)
-    shape = RAD_SHAPE[resolution]
     if rad is None:
-        rad_data = (np.arange(shape[0] * shape[1]).reshape(shape) + 1.0) * 50.0
-        rad_data = (rad_data + 1.0) / 0.5
-        rad_data = rad_data.astype(np.int16)
         rad = xr.DataArray(
-            da.from_array(rad_data, chunks=226),
+            da.from_array(_fake_rad_data(resolution), chunks=226),
             dims=("y", "x"),
             attrs={
                 "scale_factor": 0.5,
@@ -137,31 +184,32 @@ def generate_l1b_filename(chan_name: str) -> str:
     return f"OR_ABI-L1b-RadC-M4{chan_name}_G16_s20161811540362_e20161811545170_c20161811545230_suffix.nc"
 
 
-@pytest.fixture
-def c01_refl(tmp_path) -> xr.DataArray:
-    """Load c01 reflectances."""
+# The readers and loaded data arrays below are module-scoped and shared
+# between tests, so tests must not modify them in place.
+@pytest.fixture(scope="module")
+def c01_reader(tmp_path_factory) -> FileYAMLReader:
+    """Create a reader for a default c01 file."""
     with _apply_dask_chunk_size():
-        reader = _create_reader_for_data(tmp_path, "C01", None, 1000)
-        return reader.load(["C01"])["C01"]
+        return _create_reader_for_data(tmp_path_factory.mktemp("c01"), "C01", None, 1000)
 
 
-@pytest.fixture
-def c01_rad(tmp_path) -> xr.DataArray:
+@pytest.fixture(scope="module")
+def c01_refl(c01_reader) -> xr.DataArray:
+    """Load c01 reflectances."""
+    return c01_reader.load(["C01"])["C01"]
+
+
+@pytest.fixture(scope="module")
+def c01_rad(c01_reader) -> xr.DataArray:
     """Load c01 radiances."""
-    with _apply_dask_chunk_size():
-        reader = _create_reader_for_data(tmp_path, "C01", None, 1000)
-        return reader.load([DataQuery(name="C01", calibration="radiance")])["C01"]
+    return c01_reader.load([DataQuery(name="C01", calibration="radiance")])["C01"]
 
 
-@pytest.fixture
-def c01_rad_h5netcdf(tmp_path) -> xr.DataArray:
+@pytest.fixture(scope="module")
+def c01_rad_h5netcdf(tmp_path_factory) -> xr.DataArray:
     """Load c01 radiances through h5netcdf."""
-    shape = RAD_SHAPE[1000]
-    rad_data = (np.arange(shape[0] * shape[1]).reshape(shape) + 1.0) * 50.0
-    rad_data = (rad_data + 1.0) / 0.5
-    rad_data = rad_data.astype(np.int16)
     rad = xr.DataArray(
-        da.from_array(rad_data, chunks=226),
+        da.from_array(_fake_rad_data(1000), chunks=226),
         dims=("y", "x"),
         attrs={
             "scale_factor": 0.5,
@@ -172,31 +220,31 @@ def c01_rad_h5netcdf(tmp_path) -> xr.DataArray:
         },
     )
     with _apply_dask_chunk_size():
-        reader = _create_reader_for_data(tmp_path, "C01", rad, 1000)
+        reader = _create_reader_for_data(tmp_path_factory.mktemp("c01_rad_h5netcdf"), "C01", rad, 1000)
         return reader.load([DataQuery(name="C01", calibration="radiance")])["C01"]
 
 
-@pytest.fixture
-def c01_counts(tmp_path) -> xr.DataArray:
+@pytest.fixture(scope="module")
+def c01_counts(c01_reader) -> xr.DataArray:
     """Load c01 counts."""
-    with _apply_dask_chunk_size():
-        reader = _create_reader_for_data(tmp_path, "C01", None, 1000)
-        return reader.load([DataQuery(name="C01", calibration="counts")])["C01"]
+    return c01_reader.load([DataQuery(name="C01", calibration="counts")])["C01"]
+
+
+@pytest.fixture(scope="module")
+def c07_path(tmp_path_factory) -> Path:
+    """Write a c07 file with a radiance below the minimum expected radiance."""
+    return _create_fake_data_file(tmp_path_factory.mktemp("c07"), "C07", _fake_c07_data(), 2000)
 
 
-@pytest.fixture
-def c07_bt_creator(tmp_path) -> Callable:
+@pytest.fixture(scope="module")
+def c07_bt_creator(c07_path) -> Callable:
     """Create a loader for c07 brightness temperatures."""
     def _load_data_array(
         clip_negative_radiances: bool = False,
     ):
-        rad = _fake_c07_data()
         with _apply_dask_chunk_size():
-            reader = _create_reader_for_data(
-                tmp_path,
-                "C07",
-                rad,
-                2000,
+            reader = _create_reader_for_file(
+                c07_path,
                 {"clip_negative_radiances": clip_negative_radiances},
             )
             return reader.load(["C07"])["C07"]
@@ -205,14 +253,8 @@ def c07_bt_creator(tmp_path) -> Callable:
 
 
 def _fake_c07_data() -> xr.DataArray:
-    shape = RAD_SHAPE[2000]
-    values = np.arange(shape[0] * shape[1])
-    rad_data = (values.reshape(shape) + 1.0) * 50.0
-    rad_data[0, 0] = -0.0001  # introduce below minimum expected radiance
-    rad_data = (rad_data + 1.3) / 0.5
-    data = rad_data.astype(np.int16)
     rad = xr.DataArray(
-        da.from_array(data, chunks=226),
+        da.from_array(_C07_RAD_DATA, chunks=226),
         dims=("y", "x"),
         attrs={
             "scale_factor": 0.5,
@@ -232,6 +274,16 @@ def _create_reader_for_data(
         resolution: int,
         reader_kwargs: dict[str, Any] | None = None,
 ) -> FileYAMLReader:
+    data_path = _create_fake_data_file(tmp_path, channel_name, rad, resolution)
+    return _create_reader_for_file(data_path, reader_kwargs)
+
+
+def _create_fake_data_file(
+        tmp_path: Path,
+        channel_name: str,
+        rad: xr.DataArray | None,
+        resolution: int,
+) -> Path:
     filename = generate_l1b_filename(channel_name)
     data_path = tmp_path / filename
     dataset = _create_fake_rad_dataset(rad=rad, resolution=resolution)
@@ -241,6 +293,13 @@ def _create_reader_for_data(
             "Rad": {"chunksizes": [226, 226]},
         },
     )
+    return data_path
+
+
+def _create_reader_for_file(
+        data_path: Path,
+        reader_kwargs: dict[str, Any] | None = None,
+) -> FileYAMLReader:
     from satpy.readers import load_readers
     return load_readers([str(data_path)], "abi_l1b", reader_kwargs=reader_kwargs)["abi_l1b"]
 
@@ -309,6 +368,15 @@ def _check_dims_and_coords(data_arr: xr.DataArray) -> None:
     assert "time" not in data_arr.dims
 
 
+@pytest.fixture(scope="module")
+def abi_l1b_reader() -> FileYAMLReader:
+    """Create an abi_l1b reader without any files."""
+    from satpy.readers import configs_for_reader, load_reader
+
+    reader_configs = list(configs_for_reader("abi_l1b"))[0]
+    return load_reader(reader_configs)
+
+
 @pytest.mark.parametrize(
     ("channel", "suffix"),
     [
@@ -317,34 +385,38 @@ def _check_dims_and_coords(data_arr: xr.DataArray) -> None:
         for suffix in ("", "_test_suffix")
     ],
 )
-def test_file_patterns_match(channel, suffix):
+def test_file_patterns_match(abi_l1b_reader, channel, suffix):
     """Test that the configured file patterns work."""
-    from satpy.readers import configs_for_reader, load_reader
-
-    reader_configs = list(configs_for_reader("abi_l1b"))[0]
-    reader = load_reader(reader_configs)
     fn1 = (
         "OR_ABI-L1b-RadM1-M3{}_G16_s20182541300210_e20182541300267"
         "_c20182541300308{}.nc"
     ).format(channel, suffix)
-    loadables = reader.select_files_from_pathnames([fn1])
+    loadables = abi_l1b_reader.select_files_from_pathnames([fn1])
     assert len(loadables) == 1
     if not suffix and channel in ["C01", "C02", "C03", "C05"]:
         fn2 = (
             "OR_ABI-L1b-RadM1-M3{}_G16_s20182541300210_e20182541300267"
             "_c20182541300308-000000_0.nc"
         ).format(channel)
-        loadables = reader.select_files_from_pathnames([fn2])
+        loadables = abi_l1b_reader.select_files_from_pathnames([fn2])
         assert len(loadables) == 1
 
 
-@pytest.mark.parametrize(
-    "c01_data_arr", [lazy_fixture("c01_rad"), lazy_fixture("c01_rad_h5netcdf")]
-)
 class Test_NC_ABI_L1B:
     """Test the NC_ABI_L1B reader."""
 
-    def test_get_dataset(self, c01_data_arr):
+    @pytest.mark.parametrize(
+        "c01_data_arr", [lazy_fixture("c01_rad"), lazy_fixture("c01_rad_h5netcdf")]
+    )
+    def test_get_dataset_data(self, c01_data_arr):
+        """Test the data returned by the get_dataset method.
+
+        This also covers the shape (1,) fill value attribute some backends
+        (h5netcdf) return.
+        """
+        _get_and_check_array(c01_data_arr, np.float32)
+
+    def test_get_dataset(self, c01_rad):
         """Test the get_dataset method."""
         exp = {
             "calibration": "radiance",
@@ -378,33 +450,23 @@ class Test_NC_ABI_L1B:
             "end_time": dt.datetime(2017, 9, 20, 17, 41, 17, 500000),
         }
 
-        res = c01_data_arr
-        _get_and_check_array(res, np.float32)
+        res = c01_rad
         _check_area(res)
         _check_dims_and_coords(res)
         for exp_key, exp_val in exp.items():
             assert res.attrs[exp_key] == exp_val
 
 
-@pytest.mark.parametrize("clip_negative_radiances", [False, True])
-def test_ir_calibrate(c07_bt_creator, clip_negative_radiances):
+@pytest.mark.parametrize(
+    ("clip_negative_radiances", "expected"),
+    [
+        (False, _IR_EXPECTED),
+        (True, _CLIP_IR_EXPECTED),
+    ],
+)
+def test_ir_calibrate(c07_bt_creator, clip_negative_radiances, expected):
     """Test IR calibration."""
     res = c07_bt_creator(clip_negative_radiances=clip_negative_radiances)
-    clipped_ir = 134.68753 if clip_negative_radiances else np.nan
-    expected = np.array(
-        [
-            clipped_ir,
-            304.97037,
-            332.22778,
-            354.6147,
-            374.08688,
-            391.58655,
-            407.64786,
-            422.60635,
-            436.68802,
-            np.nan,
-        ]
-    )
     data_np = _get_and_check_array(res, np.float32)
     _check_area(res)
     _check_dims_and_coords(res)
@@ -419,27 +481,19 @@ def test_ir_calibrate(c07_bt_creator, clip_negative_radiances):
     assert res.attrs["long_name"] == "Brightness Temperature"
 
 
+def test_get_minimum_radiance():
+    """Test the minimum radiance estimate used to clip IR radiances."""
+    data = xr.DataArray(attrs={"scale_factor": 0.5, "add_offset": -1.3})
+    np.testing.assert_allclose(NC_ABI_L1B._get_minimum_radiance(NC_ABI_L1B, data), 0.2)
+
+
 def test_vis_calibrate(c01_refl):
     """Test VIS calibration."""
     res = c01_refl
-    expected = np.array(
-        [
-            7.632808,
-            15.265616,
-            22.898426,
-            30.531233,
-            38.164043,
-            45.796852,
-            53.429657,
-            61.062466,
-            68.695274,
-            np.nan,
-        ]
-    )
     data_np = _get_and_check_array(res, np.float32)
     _check_area(res)
     _check_dims_and_coords(res)
-    np.testing.assert_allclose(data_np[0, :10], expected, equal_nan=True)
+    np.testing.assert_allclose(data_np[0, :10], _VIS_EXPECTED, equal_nan=True)
     assert "scale_factor" not in res.attrs
     assert "_FillValue" not in res.attrs
     assert res.attrs["standard_name"] == "toa_bidirectional_reflectance"
@@ -468,10 +522,10 @@ def test_raw_calibrate(c01_counts):
     assert res.attrs["long_name"] == "Raw Counts"
 
 
-@mock.patch("satpy.readers.abi_base.xr")
-def test_open_dataset(_):  # noqa: PT019
+def test_open_dataset():
     """Test opening a dataset."""
     openable_thing = mock.MagicMock()
 
-    NC_ABI_L1B(openable_thing, {"platform_shortname": "g16"}, {})
+    with mock.patch("satpy.readers.abi_base.xr"):
+        NC_ABI_L1B(openable_thing, {"platform_shortname": "g16"}, {})
     openable_thing.open.assert_called()